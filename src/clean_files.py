@@ -1,74 +1,66 @@
-import json
+import ijson
+import orjson
 import os
-from urllib.parse import urlparse
+import re
+
+# Buffer size sweet spot for sequential file I/O
+_BUFFER_SIZE = 64 * 1024
+
+# Patterns to exclude, compiled into one alternation so each URL is scanned once
+_EXCLUDE_PATTERNS = [
+    '.pdf',
+    '.doc',
+    '.docx',
+    '.csv',
+    'github.com',
+    'reddit.com',
+    'justdial.com',
+    'linkedin.com/jobs',
+    '/careers',
+    'quora.com',
+    '/job'
+]
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_PATTERNS)))
 
 def should_keep_url(url):
     """Determine if a URL should be kept in the results."""
     if not url:
         return False
-        
-    try:
-        parsed = urlparse(url)
-        
-        # List of patterns to exclude
-        exclude_patterns = [
-            '.pdf',
-            '.doc',
-            '.docx',
-            '.csv',
-            'github.com',
-            'reddit.com',
-            'justdial.com',
-            'linkedin.com/jobs',
-            '/careers',
-            'quora.com',
-            '/job'
-        ]
-        
-        # Check if URL contains any exclude patterns
-        url_lower = url.lower()
-        if any(pattern in url_lower for pattern in exclude_patterns):
-            return False
-            
-        return True
-    except Exception:
-        return False
+
+    return _EXCLUDE_RE.search(url.lower()) is None
 
 def clean_json_file(input_file):
-    """Clean a single JSON file."""
+    """Clean a single JSON file, streaming entries so memory stays flat."""
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if not isinstance(data, list):
-            print(f"Warning: {input_file} does not contain a JSON array")
-            return
-            
-        # Filter out entries with unwanted URLs
-        cleaned_data = []
-        removed_count = 0
-        
-        for entry in data:
-            url = entry.get('url')
-            if should_keep_url(url):
-                cleaned_data.append(entry)
-            else:
-                removed_count += 1
-                
         # Create output filename
         base_name = os.path.splitext(input_file)[0]
         output_file = f"{base_name}_cleaned.json"
-        
-        # Save cleaned data
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
-            
+
+        kept_count = 0
+        removed_count = 0
+
+        # Stream entries one at a time instead of loading the whole array
+        with open(input_file, 'rb', buffering=_BUFFER_SIZE) as f, \
+             open(output_file, 'wb', buffering=_BUFFER_SIZE) as w_f:
+            w_f.write(b'[')
+            # use_float avoids Decimal values, which orjson won't serialize
+            for entry in ijson.items(f, 'item', use_float=True):
+                url = entry.get('url')
+                if should_keep_url(url):
+                    if kept_count:
+                        w_f.write(b',\n')
+                    w_f.write(orjson.dumps(entry))
+                    kept_count += 1
+                else:
+                    removed_count += 1
+            w_f.write(b']')
+
         print(f"Processed {input_file}:")
-        print(f"- Original entries: {len(data)}")
+        print(f"- Original entries: {kept_count + removed_count}")
         print(f"- Removed entries: {removed_count}")
-        print(f"- Remaining entries: {len(cleaned_data)}")
+        print(f"- Remaining entries: {kept_count}")
         print(f"- Saved to: {output_file}\n")
-        
+
     except Exception as e:
         print(f"Error processing {input_file}: {str(e)}\n")
 
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from utils.search import SearchClient
 from utils.analysis import WebsiteAnalyzer
@@ -31,15 +32,19 @@ def main():
         "fitness center"
     ]
     
-    for industry in industries:
+    def process_industry(industry):
         # Generate and perform searches
         urls = search_client.search(city=args.city, industry=industry)
-        
+
         # Analyze each website
         results = analyzer.analyze_batch(urls)
-        
+
         # Save results
         analyzer.save_results(results, f"results_{industry.replace(' ', '_')}.json")
 
+    # Industries are independent, so run them in parallel
+    with ThreadPoolExecutor(max_workers=len(industries)) as executor:
+        list(executor.map(process_industry, industries))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,15 +2,108 @@
 Website analysis module for evaluating potential client websites.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import aiohttp
+import diskcache
+import os
+from dataclasses import dataclass, field
+from selectolax.parser import HTMLParser
 from typing import List, Dict, Any
-import json
+from urllib.parse import urlsplit, urlunsplit
+import orjson
 import re
-import time
+import threading
 from datetime import datetime
 
+from .search import RateLimiter
+
+# Pre-compiled patterns for contact extraction (hot path in batch analysis)
+_EMAIL_RE = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+_PHONE_RE = re.compile(r'\b[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4}\b')
+
+_SOCIAL_RE = re.compile(r'facebook\.com|twitter\.com|linkedin\.com|instagram\.com')
+
+# Design-issue heuristics
+_JQUERY_RE = re.compile(r'jquery-[12]\b')
+_MODERN_CSS_RE = re.compile(r'tailwind|bootstrap-5|bulma')
+_RASTER_EXT = ('.png', '.jpg', '.jpeg')
+
+# Page fetches are I/O-bound so the default fan-out can sit well above the old
+# thread count; PageSpeed gets its own token bucket to stay under API quota.
+# The bucket is process-wide and thread-safe: batches run in parallel threads
+# (each with its own event loop), so a per-loop limiter would multiply the rate.
+_DEFAULT_CONCURRENCY = int(os.getenv('LEAD_HUNTER_CONCURRENCY', '20'))
+_PAGESPEED_QPS = 5
+_pagespeed_limiter = RateLimiter(_PAGESPEED_QPS)
+
+# Bound on the in-process memo of parsed pages
+_FACTS_CACHE_SIZE = 512
+
+# Cap on fetched page bodies so one huge page can't blow up a worker
+_MAX_BODY_BYTES = 2_000_000
+
+# Cache TTLs: PageSpeed scores go stale quickly, raw HTML much slower
+_PAGESPEED_CACHE_TTL = 3600
+_HTML_CACHE_TTL = 86400
+
+def _cache_key(url: str) -> str:
+    """Normalize a URL for caching by stripping query noise and fragments."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+@dataclass
+class PageFacts:
+    """Everything the extractors need from a page, gathered in one DOM walk."""
+    text: str = ''
+    hrefs: List[str] = field(default_factory=list)
+    images: List[Dict[str, Any]] = field(default_factory=list)
+    scripts: List[str] = field(default_factory=list)
+    stylesheets: List[str] = field(default_factory=list)
+    has_viewport: bool = False
+
+def _walk(tree: HTMLParser) -> PageFacts:
+    """
+    Traverse the parsed tree once, collecting the text buffer, link/image/
+    script/stylesheet lists and the viewport flag in a single pass.
+
+    Args:
+        tree (HTMLParser): Parsed HTML content
+
+    Returns:
+        PageFacts: Collected page facts
+    """
+    text_parts = []
+    facts = PageFacts()
+
+    for node in tree.root.traverse(include_text=True):
+        tag = node.tag
+        if tag == '-text':
+            content = node.text_content
+            if content:
+                text_parts.append(content)
+        elif tag == 'a':
+            href = node.attributes.get('href')
+            if href:
+                facts.hrefs.append(href)
+        elif tag == 'img':
+            facts.images.append(node.attributes)
+        elif tag == 'script':
+            src = node.attributes.get('src')
+            if src:
+                facts.scripts.append(src)
+        elif tag == 'link':
+            attrs = node.attributes
+            if (attrs.get('rel') or '').lower() == 'stylesheet':
+                href = attrs.get('href')
+                if href:
+                    facts.stylesheets.append(href)
+        elif tag == 'meta':
+            if (node.attributes.get('name') or '').lower() == 'viewport':
+                facts.has_viewport = True
+
+    facts.text = ''.join(text_parts)
+    return facts
+
 class WebsiteAnalyzer:
     def __init__(self, pagespeed_api_key: str):
         """
@@ -23,130 +116,144 @@ class WebsiteAnalyzer:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        # Disk caches so reruns skip the network entirely
+        self._pagespeed_cache = diskcache.Cache('lead_hunter_cache/pagespeed')
+        self._html_cache = diskcache.Cache('lead_hunter_cache/html')
+        # Bounded in-process memo of parsed pages: url -> (PageFacts, truncated).
+        # Batches run in parallel threads, so access goes through a lock.
+        self._facts_cache = {}
+        self._facts_cache_lock = threading.Lock()
 
-    def _get_pagespeed_score(self, url: str) -> Dict[str, float]:
+    async def _get_pagespeed_score(self, session: aiohttp.ClientSession, url: str) -> Dict[str, float]:
         """
         Get PageSpeed Insights scores for a URL.
-        
+
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session
             url (str): Website URL to analyze
-        
+
         Returns:
             Dict[str, float]: Dictionary containing performance metrics
         """
         try:
+            cache_key = _cache_key(url)
+            cached = self._pagespeed_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             api_url = (
                 "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
                 f"?url={url}&key={self.pagespeed_api_key}"
                 "&category=PERFORMANCE&category=ACCESSIBILITY&category=BEST_PRACTICES&category=SEO"
             )
-            response = requests.get(api_url)
-            response.raise_for_status()
-            
-            data = response.json()
+            # The bucket lets bursts through but keeps the average under quota;
+            # acquire() blocks, so hand it to a worker thread off the event loop
+            await asyncio.to_thread(_pagespeed_limiter.acquire)
+            async with session.get(api_url) as response:
+                response.raise_for_status()
+                data = await response.json()
             metrics = data['lighthouseResult']['categories']
             
-            return {
+            scores = {
                 'performance': metrics['performance']['score'] * 100,
                 'accessibility': metrics['accessibility']['score'] * 100,
                 'best_practices': metrics['best-practices']['score'] * 100,
                 'seo': metrics['seo']['score'] * 100
             }
+            self._pagespeed_cache.set(cache_key, scores, expire=_PAGESPEED_CACHE_TTL)
+            return scores
         except Exception as e:
             print(f"PageSpeed error for {url}: {str(e)}")
             return None
 
-    def _extract_contact_info(self, soup: BeautifulSoup, url: str) -> Dict[str, List[str]]:
+    def _extract_contact_info(self, facts: PageFacts, url: str) -> Dict[str, List[str]]:
         """
         Extract contact information from a webpage.
-        
+
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            facts (PageFacts): Collected page facts
             url (str): Website URL
-        
+
         Returns:
             Dict[str, List[str]]: Dictionary containing extracted contact information
         """
-        text = soup.get_text()
-        
-        # Find email addresses
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = set(re.findall(email_pattern, text))
+        text = facts.text
         
-        # Find phone numbers
-        phone_pattern = r'\b[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4}\b'
-        phones = set(re.findall(phone_pattern, text))
+        # Find email addresses (cheap '@' check avoids scanning pages without any)
+        emails = set(_EMAIL_RE.findall(text)) if '@' in text else set()
+
+        # Find phone numbers (skip the regex entirely on digit-free pages)
+        phones = set(_PHONE_RE.findall(text)) if any(c.isdigit() for c in text) else set()
         
         # Find social media links
-        social_links = []
-        social_domains = ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com']
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if any(domain in href.lower() for domain in social_domains):
-                social_links.append(href)
-        
+        social_links = set()
+        for href in facts.hrefs:
+            if _SOCIAL_RE.search(href.lower()):
+                social_links.add(href)
+
         return {
             'emails': list(emails),
             'phones': list(phones),
-            'social_links': list(set(social_links))
+            'social_links': list(social_links)
         }
 
-    def _analyze_design_issues(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _analyze_design_issues(self, facts: PageFacts) -> List[Dict[str, Any]]:
         """
         Analyze website design and identify potential issues.
-        
+
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-        
+            facts (PageFacts): Collected page facts
+
         Returns:
             List[Dict[str, Any]]: List of identified issues
         """
         issues = []
-        
+
         # Check viewport meta tag
-        if not soup.find('meta', {'name': 'viewport'}):
+        if not facts.has_viewport:
             issues.append({
                 'type': 'mobile_responsive',
                 'severity': 'high',
                 'description': 'No mobile viewport meta tag found'
             })
-        
+
         # Check for outdated frameworks
-        scripts = soup.find_all('script', src=True)
-        for script in scripts:
-            src = script['src'].lower()
-            if 'jquery-1' in src or 'jquery-2' in src:
+        for script_src in facts.scripts:
+            src = script_src.lower()
+            if _JQUERY_RE.search(src):
                 issues.append({
                     'type': 'outdated_framework',
                     'severity': 'medium',
                     'description': f'Using outdated jQuery version: {src}'
                 })
-        
-        # Check image optimization
-        images = soup.find_all('img')
-        for img in images:
-            if not img.get('alt'):
-                issues.append({
-                    'type': 'accessibility',
-                    'severity': 'medium',
-                    'description': 'Image missing alt text'
-                })
-            if img.get('src', '').endswith(('.png', '.jpg', '.jpeg')):
-                if not img.get('loading') == 'lazy':
-                    issues.append({
-                        'type': 'performance',
-                        'severity': 'low',
-                        'description': 'Image missing lazy loading'
-                    })
+
+        # Check image optimization, aggregating one record per issue type
+        missing_alt = 0
+        missing_lazy = 0
+        for attrs in facts.images:
+            if not attrs.get('alt'):
+                missing_alt += 1
+            src = (attrs.get('src') or '').lower()
+            if src.endswith(_RASTER_EXT) and attrs.get('loading') != 'lazy':
+                missing_lazy += 1
+
+        if missing_alt:
+            issues.append({
+                'type': 'accessibility',
+                'severity': 'medium',
+                'description': f'{missing_alt} image(s) missing alt text'
+            })
+        if missing_lazy:
+            issues.append({
+                'type': 'performance',
+                'severity': 'low',
+                'description': f'{missing_lazy} image(s) missing lazy loading'
+            })
 
         # Check for CSS frameworks
-        links = soup.find_all('link', rel='stylesheet')
-        modern_frameworks = False
-        for link in links:
-            href = link.get('href', '').lower()
-            if any(fw in href for fw in ['tailwind', 'bootstrap-5', 'bulma']):
-                modern_frameworks = True
-                break
+        modern_frameworks = any(
+            _MODERN_CSS_RE.search(href.lower()) for href in facts.stylesheets
+        )
         
         if not modern_frameworks:
             issues.append({
@@ -157,35 +264,72 @@ class WebsiteAnalyzer:
         
         return issues
 
-    def analyze_website(self, url: str) -> Dict[str, Any]:
+    async def analyze_website(self, session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of a website.
-        
+
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session
             url (str): Website URL to analyze
-        
+
         Returns:
             Dict[str, Any]: Analysis results
         """
+        # Fire the PageSpeed request alongside the page fetch so the two
+        # round-trips overlap instead of running back to back
+        pagespeed_task = asyncio.create_task(
+            self._get_pagespeed_score(session, url)
+        )
         try:
-            # Fetch webpage content
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+            # Fetch webpage content, hitting the disk cache first on reruns.
+            # Raw bytes go straight to the parser; decoding happens in C there,
+            # so no intermediate Python str is ever built for the body.
+            cache_key = _cache_key(url)
+            with self._facts_cache_lock:
+                cached_facts = self._facts_cache.get(cache_key)
+            if cached_facts is not None:
+                facts, truncated = cached_facts
+            else:
+                body = self._html_cache.get(cache_key)
+                if body is None:
+                    chunks = []
+                    read = 0
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        response.raise_for_status()
+                        # Stream the body and stop past the cap instead of reading it all
+                        async for chunk in response.content.iter_chunked(65536):
+                            chunks.append(chunk)
+                            read += len(chunk)
+                            if read > _MAX_BODY_BYTES:
+                                break
+                    body = b''.join(chunks)
+                    self._html_cache.set(cache_key, body, expire=_HTML_CACHE_TTL)
+                # A body longer than the cap means the fetch stopped mid-stream
+                truncated = len(body) > _MAX_BODY_BYTES
+                facts = _walk(HTMLParser(body))
+                with self._facts_cache_lock:
+                    if len(self._facts_cache) >= _FACTS_CACHE_SIZE:
+                        # Evict the oldest entry; dicts keep insertion order
+                        self._facts_cache.pop(next(iter(self._facts_cache)), None)
+                    self._facts_cache[cache_key] = (facts, truncated)
+
             # Gather all analysis data
             result = {
                 'url': url,
                 'timestamp': datetime.now().isoformat(),
-                'pagespeed': self._get_pagespeed_score(url),
-                'contact_info': self._extract_contact_info(soup, url),
-                'design_issues': self._analyze_design_issues(soup),
+                'pagespeed': await pagespeed_task,
+                'contact_info': self._extract_contact_info(facts, url),
+                'design_issues': self._analyze_design_issues(facts),
                 'status': 'success'
             }
-            
+            if truncated:
+                result['truncated'] = True
+
             return result
-            
+
         except Exception as e:
+            # The page itself is unreachable, so its PageSpeed report is moot
+            pagespeed_task.cancel()
             return {
                 'url': url,
                 'timestamp': datetime.now().isoformat(),
@@ -193,29 +337,39 @@ class WebsiteAnalyzer:
                 'status': 'error'
             }
 
-    def analyze_batch(self, urls: List[str], max_workers: int = 5) -> List[Dict[str, Any]]:
+    async def _analyze_batch_async(self, urls: List[str], max_concurrency: int) -> List[Dict[str, Any]]:
+        """
+        Fan out website analysis over a shared session with bounded concurrency.
+
+        Args:
+            urls (List[str]): List of URLs to analyze
+            max_concurrency (int): Maximum number of in-flight analyses
+
+        Returns:
+            List[Dict[str, Any]]: Analysis results for all websites
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=50)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            async def bounded(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.analyze_website(session, url)
+
+            return list(await asyncio.gather(*(bounded(url) for url in urls)))
+
+    def analyze_batch(self, urls: List[str], max_concurrency: int = _DEFAULT_CONCURRENCY) -> List[Dict[str, Any]]:
         """
         Analyze multiple websites concurrently.
-        
+
         Args:
             urls (List[str]): List of URLs to analyze
-            max_workers (int): Maximum number of concurrent workers
-        
+            max_concurrency (int): Maximum number of concurrent analyses,
+                defaults to the LEAD_HUNTER_CONCURRENCY env var (20)
+
         Returns:
             List[Dict[str, Any]]: Analysis results for all websites
         """
-        results = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_url = {executor.submit(self.analyze_website, url): url 
-                           for url in urls}
-            
-            for future in future_to_url:
-                result = future.result()
-                results.append(result)
-                # Respect API rate limits
-                time.sleep(1)
-        
-        return results
+        return asyncio.run(self._analyze_batch_async(urls, max_concurrency))
 
     def save_results(self, results: List[Dict[str, Any]], filename: str) -> None:
         """
@@ -225,5 +379,5 @@ class WebsiteAnalyzer:
             results (List[Dict[str, Any]]): Analysis results to save
             filename (str): Output filename
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
\ No newline at end of file
@@ -3,10 +3,51 @@ Search module for finding potential client websites using various search engines
 """
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
-import time
 from urllib.parse import urlparse
 import re
+import threading
+import time
+
+# Google Custom Search allows 10 queries per second by default
+_SEARCH_QPS = 10
+
+# Matches Justdial business detail pages, e.g. /some-business-XYZ123_BZDET
+_JUSTDIAL_RE = re.compile(r'/[^/]+-[A-Z0-9]+_BZDET/?$')
+
+# Blocked hosts matched exactly or by registered-domain suffix, so
+# e.g. m.facebook.com is caught but notfacebook.com is not
+_BLOCKED_DOMAINS = frozenset({'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com', 'reddit.com', 'github.com', 'justdial.com', 'quora.com'})
+_BLOCKED_DOMAIN_SUFFIXES = tuple('.' + domain for domain in _BLOCKED_DOMAINS)
+_BLOCKED_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.csv')
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per `per` seconds."""
+
+    def __init__(self, rate: int, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._updated) * (self.rate / self.per)
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * (self.per / self.rate)
+            time.sleep(wait)
 
 class SearchClient:
     def __init__(self, api_key: str, cx: str):
@@ -19,6 +60,16 @@ class SearchClient:
         self.api_key = api_key
         self.cx = cx  # custom search engine id
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        # Shared session so repeated API calls reuse pooled TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
+        # Token bucket sized to the documented quota; bursts are fine,
+        # only the sustained rate is capped
+        self._rate_limiter = RateLimiter(_SEARCH_QPS)
         self.queries = [
             '"{city}" "small business" -jobs',
             '"contact us" "{industry}" "{city}" -jobs',
@@ -48,7 +99,8 @@ class SearchClient:
                 'num': 10  # Number of results per query
             }
             
-            response = requests.get(self.base_url, params=params)
+            self._rate_limiter.acquire()
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -64,35 +116,30 @@ class SearchClient:
             
     def _filter_urls(self, urls: List[str]) -> List[str]:
         """
-        Filter URLs to remove duplicates and unwanted domains.
-        
+        Filter URLs to remove unwanted domains.
+
         Args:
-            urls (List[str]): List of URLs to filter
+            urls (List[str]): List of unique URLs to filter
         
         Returns:
             List[str]: Filtered list of URLs
         """
-        # Remove duplicates while preserving order
-        unique_urls = list(dict.fromkeys(urls))
-        
-        # Filter out unwanted domains
-        blocked_domains = {'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com', 'reddit.com', 'github.com', 'justdial.com', 'quora.com'}
-        blocked_extensions = {'.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.csv'}
-
         filtered_urls = []
-        for url in unique_urls:
+        for url in urls:
             try:
                 parsed = urlparse(url.lower())
-                
-                # Skip if domain is blocked
-                if any(domain in parsed.netloc for domain in blocked_domains):
+
+                # Skip if domain is blocked; hostname strips port and userinfo
+                # so facebook.com:443 or user@facebook.com can't slip through
+                host = parsed.hostname or ''
+                if host in _BLOCKED_DOMAINS or host.endswith(_BLOCKED_DOMAIN_SUFFIXES):
                     continue
-                    
+
                 # Skip if file extension is blocked
-                if any(url.lower().endswith(ext) for ext in blocked_extensions):
+                if parsed.path.endswith(_BLOCKED_EXTENSIONS):
                     continue
                 if 'justdial.com' in parsed.netloc:
-                    if re.search(r'/[^/]+-[A-Z0-9]+_BZDET/?$', parsed.path):
+                    if _JUSTDIAL_RE.search(parsed.path):
                         filtered_urls.append(url)
                     continue
                 
@@ -115,26 +162,27 @@ class SearchClient:
         Returns:
             List[str]: List of unique URLs matching the search criteria
         """
+        seen = set()
         all_urls = []
-        
-        for query_template in self.queries:
-            # Format the query
-            query = query_template.format(
-                city=city,
-                industry=industry
-            )
-            
-            # Execute search
-            urls = self._execute_search(query)
-            all_urls.extend(urls)
-            
-            # Respect API rate limits
-            time.sleep(1)
-            
-            # Stop if we have enough results
-            if len(all_urls) >= max_results:
-                break
-        
+        queries = [template.format(city=city, industry=industry) for template in self.queries]
+
+        # Run all queries in parallel; Custom Search allows this within its QPS quota
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = [executor.submit(self._execute_search, query) for query in queries]
+
+            for future in as_completed(futures):
+                # Dedup inline so overlapping queries don't pad out the batch
+                for url in future.result():
+                    if url not in seen:
+                        seen.add(url)
+                        all_urls.append(url)
+
+                # Stop if we have enough unique results
+                if len(all_urls) >= max_results:
+                    for remaining in futures:
+                        remaining.cancel()
+                    break
+
         # Filter and limit results
         filtered_urls = self._filter_urls(all_urls)
         return filtered_urls[:max_results]
\ No newline at end of file